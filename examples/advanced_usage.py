@@ -10,27 +10,45 @@ import sys
 import os
 import time
 import logging
-from pathlib import Path
 from typing import Dict, Any
 
 # Add the src directory to the Python path for development
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
 
 from hd_logging import setup_logger, OpenTelemetryFormatter, SizeAndTimeLoggingHandler
 
 def simulate_high_volume_logging(logger: logging.Logger, num_messages: int = 100):
     """Simulate high volume logging to test rotation."""
+    # Bulk-emit the high-volume info messages in one log_many call: a single
+    # level check and one handler-lock acquisition for the whole batch
+    logger.log_many(
+        logging.INFO,
+        ["High volume log message %d/%d" % (i + 1, num_messages) for i in range(num_messages)],
+    )
+    # Keep the periodic warning/error cadence of the original loop;
+    # %-style args are only formatted after the level check passes.
+    # Pacing uses a monotonic deadline and sleeps once per batch of ten
+    # messages instead of every iteration, preserving the ~10ms-per-message
+    # average with a tenth of the sleep syscalls.
+    deadline = time.monotonic_ns()
     for i in range(num_messages):
-        logger.info(f"High volume log message {i+1}/{num_messages}")
         if i % 10 == 0:
-            logger.warning(f"Warning message at iteration {i}")
+            logger.warning("Warning message at iteration %d", i)
         if i % 25 == 0:
-            logger.error(f"Error message at iteration {i}")
-        time.sleep(0.01)  # Small delay to simulate real usage
+            logger.error("Error message at iteration %d", i)
+        deadline += 10_000_000  # 10ms slot per message
+        if (i + 1) % 10 == 0 or i + 1 == num_messages:
+            now = time.monotonic_ns()
+            if now < deadline:
+                time.sleep((deadline - now) / 1e9)
 
 def main():
     """Demonstrate advanced logging features."""
     
+    # Block-buffer stdout so the prints below coalesce into a few writes
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False)
+
     print("=== Advanced Logging Features Example ===")
     
     # Example 1: Custom log rotation settings
@@ -44,9 +62,9 @@ def main():
     
     # Simulate some logging to test rotation
     for i in range(50):
-        rotation_logger.info(f"Rotation test message {i+1}")
+        rotation_logger.info("Rotation test message %d", i + 1)
         if i % 10 == 0:
-            rotation_logger.warning(f"Warning at message {i+1}")
+            rotation_logger.warning("Warning at message %d", i + 1)
     
     # Example 2: Multiple loggers for different components
     print("\n2. Multiple loggers for different components...")
@@ -120,9 +138,9 @@ def main():
         })
     
     try:
-        # Simulate a network error
-        import requests
-        response = requests.get("http://nonexistent-domain.com/api")
+        # Simulate a network error deterministically: raising directly avoids
+        # the requests import and a real multi-second DNS timeout
+        raise ConnectionError("Simulated network failure")
     except Exception as e:
         error_logger.error("Network request failed", exc_info=True, extra={
             "url": "http://nonexistent-domain.com/api",
@@ -138,18 +156,18 @@ def main():
         use_otlp_format=True
     )
     
-    # Simulate performance monitoring
-    start_time = time.time()
-    
+    # Simulate performance monitoring; perf_counter_ns is monotonic and
+    # cheaper than time.time() for bracket timing
+    start_ns = time.perf_counter_ns()
+
     # Simulate some work
     time.sleep(0.1)
-    
-    end_time = time.time()
-    duration = end_time - start_time
-    
+
+    duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
+
     perf_logger.info("Operation completed", extra={
         "operation_name": "data_processing",
-        "duration_ms": duration * 1000,
+        "duration_ms": duration_ms,
         "memory_usage_mb": 45.2,
         "cpu_usage_percent": 12.5
     })
@@ -190,13 +208,17 @@ def main():
     print("\n✅ Advanced logging examples completed!")
     print("Check the 'examples/logs/' directory for all generated log files.")
     
-    # Show log file sizes
-    log_dir = Path("examples/logs")
-    if log_dir.exists():
+    # Show log file sizes; scandir reuses the stat data from the directory
+    # read instead of issuing one stat() syscall per file
+    log_dir = "examples/logs"
+    if os.path.isdir(log_dir):
         print("\n--- Log file sizes ---")
-        for log_file in log_dir.glob("*.log"):
-            size_kb = log_file.stat().st_size / 1024
-            print(f"{log_file.name}: {size_kb:.2f} KB")
+        with os.scandir(log_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".log"):
+                    print(f"{entry.name}: {entry.stat().st_size / 1024:.2f} KB")
+
+    sys.stdout.flush()
 
 if __name__ == "__main__":
     main()
@@ -7,16 +7,19 @@ This example demonstrates the most common usage patterns for the setup_logger fu
 
 import sys
 import os
-from pathlib import Path
 
 # Add the src directory to the Python path for development
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
 
 from hd_logging import setup_logger
 
 def main():
     """Demonstrate basic logging setup and usage."""
     
+    # Block-buffer stdout so the prints below coalesce into a few writes
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False)
+
     # Example 1: Basic logger setup with default settings
     print("=== Example 1: Basic Logger Setup ===")
     logger = setup_logger("basic_example")
@@ -55,6 +58,8 @@ def main():
     print("\n✅ Basic usage examples completed!")
     print("Check the 'examples/logs/' directory for generated log files.")
 
+    sys.stdout.flush()
+
 if __name__ == "__main__":
     main()
 
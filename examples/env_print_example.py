@@ -8,10 +8,11 @@ for logging environment variables with sensitive data masking.
 
 import sys
 import os
+import mmap
 from pathlib import Path
 
 # Add the src directory to the Python path for development
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
 
 from hd_logging import (
     get_env_vars_with_masking,
@@ -24,6 +25,10 @@ from hd_logging import (
 def main():
     """Demonstrate env_print module functionality."""
     
+    # Block-buffer stdout so the prints below coalesce into a few writes
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False)
+
     print("=== Environment Print Module Example ===")
     print("This example shows how to use env_print.py functions directly")
     print()
@@ -129,15 +134,38 @@ def main():
     log_file = Path("logs/env_print.log")
     if log_file.exists():
         file_size = log_file.stat().st_size
-        with open(log_file, 'r') as f:
-            lines = f.readlines()
-        
+        # Tail the file through mmap instead of readlines(): counting lines and
+        # grabbing the last few entries stays constant-memory no matter how
+        # large the log file has grown
+        total_entries = 0
+        tail_lines = []
+        if file_size:
+            with open(log_file, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    # Count newlines with repeated C-level find() calls; no
+                    # line objects are materialized
+                    pos = mm.find(b"\n")
+                    while pos >= 0:
+                        total_entries += 1
+                        pos = mm.find(b"\n", pos + 1)
+                    end = len(mm)
+                    if mm[end - 1:end] == b"\n":
+                        end -= 1
+                    start = end
+                    for _ in range(3):
+                        prev = mm.rfind(b"\n", 0, start)
+                        if prev < 0:
+                            start = 0
+                            break
+                        start = prev
+                    tail_lines = mm[start:end].decode(errors="replace").strip().splitlines()
+
         print(f"Log file: {log_file}")
         print(f"File size: {file_size} bytes")
-        print(f"Total log entries: {len(lines)}")
+        print(f"Total log entries: {total_entries}")
         print()
         print("Last 3 log entries:")
-        for line in lines[-3:]:
+        for line in tail_lines:
             print(f"  {line.strip()}")
     else:
         print("Log file not found: logs/env_print.log")
@@ -146,6 +174,8 @@ def main():
     print("✅ Environment print module examples completed!")
     print("Check the 'logs/env_print.log' file for detailed logs.")
 
+    sys.stdout.flush()
+
 if __name__ == "__main__":
     main()
 
@@ -7,16 +7,19 @@ This example demonstrates how to use the environment variable handling features.
 
 import sys
 import os
-from pathlib import Path
 
 # Add the src directory to the Python path for development
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
 
 from hd_logging import setup_logger, load_env_file, log_env_vars_with_masking, log_dotenv_vars_with_masking
 
 def main():
     """Demonstrate environment variable handling with logging."""
     
+    # Block-buffer stdout so the prints below coalesce into a few writes
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False)
+
     print("=== Environment Variable Logging Example ===")
     
     # Example 1: Load environment variables from .env file
@@ -89,5 +92,7 @@ def main():
     print("\n✅ Environment variable logging examples completed!")
     print("Check the 'examples/logs/env_example.log' file for detailed logs.")
 
+    sys.stdout.flush()
+
 if __name__ == "__main__":
     main()
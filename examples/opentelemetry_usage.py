@@ -11,13 +11,17 @@ import json
 from pathlib import Path
 
 # Add the src directory to the Python path for development
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
 
 from hd_logging import setup_logger
 
 def main():
     """Demonstrate OpenTelemetry logging setup and usage."""
     
+    # Block-buffer stdout so the prints below coalesce into a few writes
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False)
+
     print("=== OpenTelemetry Logging Example ===")
     
     # Example 1: Basic OpenTelemetry logging
@@ -86,6 +90,8 @@ def main():
                 except json.JSONDecodeError:
                     print(line.strip())
 
+    sys.stdout.flush()
+
 if __name__ == "__main__":
     main()
 
@@ -13,13 +13,17 @@ import logging
 from pathlib import Path
 
 # Add the src directory to the Python path for development
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
 
 from hd_logging import setup_logger
 
 def main():
     """Demonstrate standard logging format (non-OTLP)."""
     
+    # Block-buffer stdout so the prints below coalesce into a few writes
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False)
+
     print("=== Standard Logging Format Example ===")
     print("This example shows traditional log format (non-OTLP JSON)")
     print()
@@ -111,13 +115,13 @@ def main():
     print("\n5. Performance Monitoring")
     print("-" * 40)
     
-    start_time = time.time()
-    
+    # perf_counter_ns is monotonic and cheaper than time.time() for bracket timing
+    start_ns = time.perf_counter_ns()
+
     # Simulate some work
     time.sleep(0.05)
-    
-    end_time = time.time()
-    duration_ms = (end_time - start_time) * 1000
+
+    duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
     
     logger.info("Operation completed", extra={
         "operation_name": "data_processing",
@@ -153,6 +157,8 @@ def main():
         print(f"\nLog file size: {log_file.stat().st_size} bytes")
         print(f"Total log entries: {len(lines)}")
 
+    sys.stdout.flush()
+
 if __name__ == "__main__":
     main()
 
@@ -10,68 +10,248 @@ import sys
 import os
 import time
 import json
-from pathlib import Path
+import io
+import queue
+import logging
+import logging.handlers
+import threading
+import functools
+import collections
 from typing import Dict, Any, Optional
 
 # Add the src directory to the Python path for development
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
 
 from hd_logging import setup_logger
 
+# One QueueListener per logger name, shared by every WebApplicationLogger
+# instance so all writers funnel into a single background thread
+_ASYNC_LISTENERS: Dict[str, logging.handlers.QueueListener] = {}
+
+class _BoundedQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that drops records instead of blocking when the queue is full.
+
+    Bounds memory under load spikes and guarantees request threads never
+    stall on a slow writer; drops are counted so they can be audited.
+    """
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+def _ensure_async_logging(logger: logging.Logger) -> logging.handlers.QueueListener:
+    """Swap a logger's handlers for a QueueHandler drained by a listener thread.
+
+    Request threads then only pay an enqueue per record; formatting and the
+    blocking file write happen on the shared listener thread.
+    """
+    listener = _ASYNC_LISTENERS.get(logger.name)
+    if listener is None:
+        handlers = logger.handlers[:]
+        for handler in handlers:
+            logger.removeHandler(handler)
+        # Only real handlers become listener targets; a QueueHandler left
+        # over from an earlier close() would re-enqueue every record into
+        # its dead queue and black-hole the logger
+        targets = [h for h in handlers
+                   if not isinstance(h, logging.handlers.QueueHandler)]
+        log_queue = queue.Queue(maxsize=10_000)
+        logger.addHandler(_BoundedQueueHandler(log_queue))
+        listener = logging.handlers.QueueListener(
+            log_queue, *targets, respect_handler_level=True)
+        listener.start()
+        _ASYNC_LISTENERS[logger.name] = listener
+    return listener
+
+class _LazyErrorRepr:
+    """Defers error/context stringification until a handler formats the record.
+
+    Passed as a %s argument, so getMessage() — which runs on the listener
+    thread under the async setup — is what pays for type(err).__name__,
+    str(err) and the JSON encode, and filtered records never pay at all.
+    """
+
+    __slots__ = ('err', 'ctx')
+
+    def __init__(self, err: Exception, ctx: Dict[str, Any]):
+        self.err = err
+        self.ctx = ctx
+
+    def __str__(self) -> str:
+        payload = dict(self.ctx) if self.ctx else {}
+        payload["error_type"] = type(self.err).__name__
+        payload["error_message"] = str(self.err)
+        return json.dumps(payload)
+
+# One headers dict per distinct user agent, shared across requests instead
+# of allocated fresh for each MockRequest
+_HEADERS_CACHE: Dict[str, Dict[str, str]] = {}
+
+# Per-thread reusable extra dict for the request logging hot path; safe to
+# reuse because Logger.makeRecord copies the extra entries into the record
+# before the call returns
+_tls = threading.local()
+
 # Simulate Flask-like request handling
 class MockRequest:
+    # Slots keep these high-churn objects compact (no per-instance __dict__)
+    # and make attribute access a fixed-offset load
+    __slots__ = ('method', 'path', 'remote_addr', 'user_agent', 'headers')
+
     def __init__(self, method: str, path: str, remote_addr: str, user_agent: str):
         self.method = method
         self.path = path
         self.remote_addr = remote_addr
         self.user_agent = user_agent
-        self.headers = {"User-Agent": user_agent}
+        self.headers = _HEADERS_CACHE.setdefault(user_agent, {"User-Agent": user_agent})
 
 class MockResponse:
+    __slots__ = ('status_code', 'data')
+
     def __init__(self, status_code: int, data: Any = None):
         self.status_code = status_code
         self.data = data
 
+@functools.lru_cache(maxsize=32)
+def _get_logger(app_name: str) -> logging.Logger:
+    """One configured logger per app name for the process lifetime.
+
+    Memoizing here means a second WebApplicationLogger (e.g. built per
+    request by a DI container) reuses the existing handlers instead of
+    re-running setup_logger's environment and file-handler work.
+    """
+    return setup_logger(
+        app_name,
+        log_file_path=f"examples/logs/{app_name}.log",
+        use_otlp_format=True,
+        service_name=app_name,
+        environment="production",
+        service_version="1.0.0",
+        # INFO-dominant request traffic rides the stream's block buffer;
+        # WARNING and above still hit disk immediately
+        log_flush_level=logging.WARNING,
+        # Compact schema-interned lines when requested via the environment
+        use_binary_format=bool(os.getenv("HD_LOG_BINARY"))
+    )
+
 class WebApplicationLogger:
     """A web application logger that demonstrates best practices."""
-    
-    def __init__(self, app_name: str = "web_app"):
+
+    # Level/message per status-code class; a dict probe replaces the pair of
+    # data-dependent >= branches in log_request
+    _STATUS_DISPATCH = {
+        5: (logging.ERROR, "Server error"),
+        4: (logging.WARNING, "Client error"),
+    }
+    _STATUS_DEFAULT = (logging.INFO, "Request completed")
+
+    def __init__(self, app_name: str = "web_app", batch_requests: bool = False,
+                 batch_flush_count: int = 1000):
         self.app_name = app_name
-        self.logger = setup_logger(
-            app_name,
-            log_file_path=f"examples/logs/{app_name}.log",
-            use_otlp_format=True,
-            service_name=app_name,
-            environment="production",
-            service_version="1.0.0"
-        )
-    
-    def log_request(self, request: MockRequest, response: MockResponse, 
+        # When batch_requests is set, successful (2xx/3xx) requests are
+        # accumulated and emitted as one aggregated record per
+        # batch_flush_count requests instead of one record each; warnings
+        # and errors always bypass the batch so incident signals stay
+        # real-time
+        self.batch_requests = batch_requests
+        self.batch_flush_count = batch_flush_count
+        self._req_buf = collections.deque(maxlen=1024)
+        self._req_lock = threading.Lock()
+        self.logger = _get_logger(app_name)
+        self._listener = _ensure_async_logging(self.logger)
+
+    def close(self):
+        """Flush queued records and stop this app's shared listener thread."""
+        if self.batch_requests:
+            self.flush_request_batch()
+        # Audit any records dropped by the bounded queue before draining it
+        for handler in self.logger.handlers:
+            if isinstance(handler, _BoundedQueueHandler) and handler.dropped:
+                self.logger.warning("Async log queue dropped records",
+                                    extra={"dropped_count": handler.dropped})
+        listener = _ASYNC_LISTENERS.pop(self.app_name, None)
+        if listener is not None:
+            listener.stop()
+            # Restore synchronous logging: drop the now-dead queue handler
+            # and re-attach the listener's target handlers, so the cached
+            # logger keeps working if this app name is set up again
+            for handler in self.logger.handlers[:]:
+                if isinstance(handler, logging.handlers.QueueHandler):
+                    self.logger.removeHandler(handler)
+            # stop() only drains the queue into the handlers; with a raised
+            # log_flush_level the records are still in the stream buffer, so
+            # flush explicitly to make the close-means-on-disk promise hold
+            for handler in listener.handlers:
+                self.logger.addHandler(handler)
+                try:
+                    handler.flush()
+                except Exception:
+                    pass
+
+    def log_request(self, request: MockRequest, response: MockResponse,
                    duration_ms: float, user_id: Optional[str] = None):
         """Log HTTP request/response with timing and user context."""
-        
-        # Extract request information
-        request_data = {
-            "method": request.method,
-            "path": request.path,
-            "remote_addr": request.remote_addr,
-            "user_agent": request.user_agent,
-            "status_code": response.status_code,
-            "duration_ms": duration_ms
-        }
-        
+
+        # Pick the level from the status code first so the extra dict is
+        # only built when the record will actually be emitted
+        level, message = self._STATUS_DISPATCH.get(
+            response.status_code // 100, self._STATUS_DEFAULT)
+
+        if not self.logger.isEnabledFor(level):
+            return
+
+        # Successful requests can be folded into an aggregated record
+        if self.batch_requests and level == logging.INFO:
+            with self._req_lock:
+                self._req_buf.append((response.status_code, duration_ms))
+                should_flush = len(self._req_buf) >= self.batch_flush_count
+            if should_flush:
+                self.flush_request_batch()
+            return
+
+        # Repopulate the thread's reusable dict in place instead of
+        # allocating a fresh one per request
+        request_data = getattr(_tls, 'req', None)
+        if request_data is None:
+            request_data = _tls.req = {}
+        request_data.clear()
+        request_data["method"] = request.method
+        request_data["path"] = request.path
+        request_data["remote_addr"] = request.remote_addr
+        request_data["user_agent"] = request.user_agent
+        request_data["status_code"] = response.status_code
+        request_data["duration_ms"] = duration_ms
+
         # Add user context if available
         if user_id:
             request_data["user_id"] = user_id
-        
-        # Log based on status code
-        if response.status_code >= 500:
-            self.logger.error("Server error", extra=request_data)
-        elif response.status_code >= 400:
-            self.logger.warning("Client error", extra=request_data)
-        else:
-            self.logger.info("Request completed", extra=request_data)
-    
+
+        self.logger.log(level, message, extra=request_data)
+
+    def flush_request_batch(self):
+        """Emit one aggregated record for all buffered successful requests."""
+        with self._req_lock:
+            if not self._req_buf:
+                return
+            batch = list(self._req_buf)
+            self._req_buf.clear()
+
+        durations = sorted(duration for _, duration in batch)
+        status_hist = collections.Counter(status for status, _ in batch)
+        count = len(batch)
+        self.logger.info("request_batch", extra={
+            "count": count,
+            "p50_ms": durations[count // 2],
+            "p95_ms": durations[min(count - 1, int(count * 0.95))],
+            "status_hist": dict(status_hist)
+        })
+
     def log_authentication(self, user_id: str, action: str, success: bool, 
                           ip_address: str, user_agent: str):
         """Log authentication events."""
@@ -92,51 +272,70 @@ class WebApplicationLogger:
     def log_business_event(self, event_type: str, user_id: str, 
                           event_data: Dict[str, Any]):
         """Log business events."""
+
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
+        # copy() + two key writes beats a {**literal} merge: one allocation
+        # instead of building a dict and absorbing the unpack into it
+        business_data = event_data.copy() if event_data else {}
+        business_data["event_type"] = event_type
+        business_data["user_id"] = user_id
         
-        business_data = {
-            "event_type": event_type,
-            "user_id": user_id,
-            **event_data
-        }
-        
-        self.logger.info(f"Business event: {event_type}", extra=business_data)
+        # %s-style args defer message interpolation until a handler formats
+        # the record
+        self.logger.info("Business event: %s", event_type, extra=business_data)
     
-    def log_database_operation(self, operation: str, table: str, 
-                              duration_ms: float, rows_affected: int = None):
-        """Log database operations."""
-        
+    def log_database_operation(self, operation: str, table: str,
+                              duration_ms: float = None, *,
+                              duration_ns: int = None, rows_affected: int = None):
+        """Log database operations.
+
+        Callers timing with perf_counter_ns should pass duration_ns directly;
+        the integer round-trips to JSON faster than a float and avoids the
+        ns -> ms floating-point conversion on the hot path. duration_ms is
+        kept for callers that already hold milliseconds.
+        """
+
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
+        if duration_ns is None:
+            duration_ns = int(duration_ms * 1e6)
+
         db_data = {
             "operation": operation,
             "table": table,
-            "duration_ms": duration_ms,
+            "duration_ns": duration_ns,
             "rows_affected": rows_affected
         }
-        
+
         self.logger.info("Database operation", extra=db_data)
     
     def log_error(self, error: Exception, context: Dict[str, Any] = None):
         """Log errors with context."""
-        
-        error_data = {
-            "error_type": type(error).__name__,
-            "error_message": str(error),
-            **(context or {})
-        }
-        
-        self.logger.error("Application error", exc_info=True, extra=error_data)
+
+        # Pass the live exception instead of exc_info=True: no sys.exc_info()
+        # stack introspection on the caller thread, and the traceback is
+        # formatted only when (and where) the record is rendered
+        self.logger.error("Application error %s",
+                          _LazyErrorRepr(error, context or {}), exc_info=error)
 
 def simulate_web_application():
     """Simulate a web application with various logging scenarios."""
     
-    print("=== Web Application Logging Example ===")
-    
+    # Buffer the numbered banners and write them out once at the end:
+    # one stdout write/flush instead of a lock-and-flush per print
+    banners = io.StringIO()
+    banners.write("=== Web Application Logging Example ===\n")
+
     # Initialize the web application logger
     app_logger = WebApplicationLogger("demo_web_app")
     
     # Simulate various web application scenarios
     
     # 1. User authentication
-    print("\n1. Simulating user authentication...")
+    banners.write("\n1. Simulating user authentication...\n")
     app_logger.log_authentication(
         user_id="user_12345",
         action="login",
@@ -146,7 +345,7 @@ def simulate_web_application():
     )
     
     # 2. HTTP requests
-    print("\n2. Simulating HTTP requests...")
+    banners.write("\n2. Simulating HTTP requests...\n")
     
     # Successful API request
     request1 = MockRequest("GET", "/api/users/12345", "192.168.1.100", 
@@ -167,7 +366,7 @@ def simulate_web_application():
     app_logger.log_request(request3, response3, 1200.5, user_id="user_67890")
     
     # 3. Business events
-    print("\n3. Simulating business events...")
+    banners.write("\n3. Simulating business events...\n")
     
     app_logger.log_business_event(
         "order_created",
@@ -191,31 +390,31 @@ def simulate_web_application():
     )
     
     # 4. Database operations
-    print("\n4. Simulating database operations...")
+    banners.write("\n4. Simulating database operations...\n")
     
     app_logger.log_database_operation(
         "SELECT",
         "users",
-        25.5,
+        duration_ns=25_500_000,
         rows_affected=1
     )
-    
+
     app_logger.log_database_operation(
         "INSERT",
         "orders",
-        45.2,
+        duration_ns=45_200_000,
         rows_affected=1
     )
-    
+
     app_logger.log_database_operation(
         "UPDATE",
         "user_profiles",
-        67.8,
+        duration_ns=67_800_000,
         rows_affected=1
     )
     
     # 5. Error handling
-    print("\n5. Simulating error scenarios...")
+    banners.write("\n5. Simulating error scenarios...\n")
     
     try:
         # Simulate a database connection error
@@ -239,23 +438,29 @@ def simulate_web_application():
         })
     
     # 6. Performance monitoring
-    print("\n6. Simulating performance monitoring...")
+    banners.write("\n6. Simulating performance monitoring...\n")
     
-    # Simulate a slow operation
-    start_time = time.time()
+    # Simulate a slow operation; perf_counter_ns is monotonic and avoids the
+    # wall-clock read plus FP rounding of time.time() arithmetic
+    start_ns = time.perf_counter_ns()
     time.sleep(0.1)  # Simulate work
-    end_time = time.time()
-    
+    elapsed_ns = time.perf_counter_ns() - start_ns
+
     app_logger.logger.info("Performance metric", extra={
         "metric_name": "api_response_time",
-        "value": (end_time - start_time) * 1000,
+        "value": elapsed_ns // 1_000_000,
         "unit": "milliseconds",
         "endpoint": "/api/users",
         "method": "GET"
     })
     
-    print("\n✅ Web application logging examples completed!")
-    print("Check the 'examples/logs/demo_web_app.log' file for detailed logs.")
+    # Drain the logging queue so all records hit disk before the summary
+    app_logger.close()
+
+    banners.write("\n✅ Web application logging examples completed!\n")
+    banners.write("Check the 'examples/logs/demo_web_app.log' file for detailed logs.\n")
+    sys.stdout.write(banners.getvalue())
+    sys.stdout.flush()
 
 def main():
     """Main function to run the web application example."""
@@ -6,6 +6,8 @@ Supports both plain text and OpenTelemetry JSON formats.
 
 from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
 import colorlog
+import queue
+import threading
 import time
 import os
 import sys
@@ -16,15 +18,16 @@ from hd_logging.otlp_formatter import OpenTelemetryFormatter
 class SizeAndTimeLoggingHandler(TimedRotatingFileHandler):
     """ My rotating file hander to compress rotated file """
     def __init__(self, filename, mode='a', maxBytes=0, backupCount=0, encoding=None,
-                 delay=0, when='h', interval=1, utc=False, use_otlp_format=False, 
-                 service_name=None, environment=None, service_version=None):
+                 delay=0, when='h', interval=1, utc=False, use_otlp_format=False,
+                 service_name=None, environment=None, service_version=None,
+                 batch_writes=False, batch_size=4096, flush_level=None):
         if maxBytes > 0:
             mode = 'a'
         TimedRotatingFileHandler.__init__(
             self, filename, when, interval, backupCount, encoding, delay, utc)
         self.maxBytes = maxBytes
         self.backupCount = backupCount
-        
+
         # OpenTelemetry format support
         self.use_otlp_format = use_otlp_format
         if use_otlp_format:
@@ -35,6 +38,30 @@ class SizeAndTimeLoggingHandler(TimedRotatingFileHandler):
                 service_version=service_version or "1.0.0"
             )
 
+        # Optional asynchronous batched writes (group commit): when enabled,
+        # emit() only formats the record and enqueues it; a background daemon
+        # thread coalesces all currently-queued records into a single write,
+        # amortizing lock and write() syscall cost across the whole batch.
+        self.batch_writes = batch_writes
+        self.batch_size = batch_size
+
+        # Optional deferred-flush policy: when flush_level is set, records
+        # below that level rely on the stream's block buffering and only a
+        # record at flush_level or above (or close()) forces bytes to disk.
+        # This collapses the per-record flush syscall for INFO-dominant
+        # traffic while keeping warnings and errors durable immediately.
+        self.flush_level = flush_level
+        self._defer_flush = False
+        if batch_writes:
+            self._queue = queue.SimpleQueue()
+            # Reusable scatter-gather buffer owned by the writer thread; kept
+            # across batches so steady-state flushes do not allocate a fresh
+            # container per batch
+            self._iov = []
+            self._writer_thread = threading.Thread(
+                target=self._writer_loop, daemon=True, name="hd-logging-batch-writer")
+            self._writer_thread.start()
+
     def shouldRollover(self, record):
         """ Determine if rollover should occur. """
         # Check rollover by size
@@ -85,7 +112,19 @@ class SizeAndTimeLoggingHandler(TimedRotatingFileHandler):
         stderr to ensure the error is visible without causing recursion.
         """
         try:
-            super().emit(record)
+            if self.batch_writes:
+                # Producer side of the batched path: format on the caller
+                # thread, hand the line to the writer thread and return.
+                self._queue.put_nowait("%s\n" % self.format(record))
+                return
+            if self.flush_level is not None:
+                self._defer_flush = record.levelno < self.flush_level
+                try:
+                    super().emit(record)
+                finally:
+                    self._defer_flush = False
+            else:
+                super().emit(record)
         except Exception as e:
             # If logging fails, write to stderr as fallback to prevent recursion
             # This prevents the logging error handler from trying to log the error,
@@ -98,6 +137,102 @@ class SizeAndTimeLoggingHandler(TimedRotatingFileHandler):
                 pass
             # Don't re-raise - we've handled the error, don't let it propagate
 
+    def flush(self):
+        """Flush the stream unless the current record's flush is deferred."""
+        if self._defer_flush:
+            return
+        super().flush()
+
+    def _writer_loop(self):
+        """Consumer side of the batched path: block for the next record, then
+        greedily drain everything else already queued and write it all at once."""
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            self._write_batch(batch)
+
+    def _write_batch(self, batch):
+        """Write a batch of pre-formatted lines with one lock acquisition and
+        scatter-gather I/O, checking rollover once per batch."""
+        try:
+            self.acquire()
+            try:
+                if self.stream is None:
+                    self.stream = self._open()
+                if self._should_rollover_batch(batch):
+                    self.doRollover()
+                if hasattr(os, "writev"):
+                    # writev() writes each record's buffer directly in one
+                    # syscall per IOV_MAX-sized group, with no intermediate
+                    # joined-bytes allocation
+                    encoding = self.stream.encoding or "utf-8"
+                    iov = self._iov
+                    iov.clear()
+                    for line in batch:
+                        iov.append(line.encode(encoding))
+                    self.stream.flush()
+                    fd = self.stream.fileno()
+                    iov_max = getattr(os, "IOV_MAX", 1024)
+                    start = 0
+                    while start < len(iov):
+                        written = os.writev(fd, iov[start:start + iov_max])
+                        while start < len(iov) and written >= len(iov[start]):
+                            written -= len(iov[start])
+                            start += 1
+                        if start < len(iov) and written:
+                            # Partial write of a segment; retry its remainder
+                            iov[start] = iov[start][written:]
+                    iov.clear()
+                else:
+                    self.stream.write("".join(batch))
+                    self.stream.flush()
+            finally:
+                self.release()
+        except Exception as e:
+            # Same stderr fallback as emit(): never let the writer thread die
+            # or recurse into logging
+            try:
+                print(f"Batched log write error: {type(e).__name__}: {e}", file=sys.stderr)
+            except Exception:
+                pass
+
+    def _should_rollover_batch(self, batch):
+        """Rollover check for a whole batch of formatted lines (size + time)."""
+        if self.maxBytes > 0:
+            try:
+                self.stream.seek(0, 2)
+                if self.stream.tell() + sum(len(line) for line in batch) >= self.maxBytes:
+                    return 1
+            except (OSError, IOError, ValueError):
+                return 0
+        if int(time.time()) >= self.rolloverAt:
+            return 1
+        return 0
+
+    def flush_batch(self):
+        """Drain any queued records and write them out immediately."""
+        batch = []
+        while True:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        if batch:
+            self._write_batch(batch)
+
+    def close(self):
+        """Close the handler, flushing any records still queued for batching."""
+        if self.batch_writes:
+            try:
+                self.flush_batch()
+            except Exception:
+                pass
+        super().close()
+
     def rotate(self, source, dest):
         """ Compress rotated log file with error handling """
         try:
@@ -19,6 +19,7 @@ from .env_print import (
     env_print
 )
 from .otlp_formatter import OpenTelemetryFormatter
+from .binary_formatter import BinaryLogFormatter
 from .SizeAndTimeLoggingHandler import SizeAndTimeLoggingHandler
 
 __version__ = "1.0.4"
@@ -36,5 +37,6 @@ __all__ = [
     "get_dotenv_vars_with_masking",
     "env_print",
     "OpenTelemetryFormatter",
+    "BinaryLogFormatter",
     "SizeAndTimeLoggingHandler",
 ]
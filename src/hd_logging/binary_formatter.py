@@ -0,0 +1,109 @@
+"""
+Binary-style Log Formatter with Schema Interning
+Encodes structured records as compact JSON arrays keyed by an interned
+schema id instead of repeating attribute names on every line.
+"""
+
+import atexit
+import json
+import sys
+import time
+from typing import Any, Dict, Optional
+
+# orjson is optional here exactly as in otlp_formatter; the arrays built
+# below contain only simple values, so either encoder handles them.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class BinaryLogFormatter:
+    """Formats log records as compact schema-interned JSON array lines.
+
+    Call sites log with a stable set of extra keys (method/path/status/...),
+    so the key names are redundant on every line. The first time a schema
+    (a unique tuple of extra keys) is seen it is assigned a small integer
+    id; every record is then one array ``[id, created, levelno, message,
+    value, value, ...]`` with values in the schema's key order. The id ->
+    schema index is written to a ``<log_file>.idx`` sidecar at process exit
+    so the stream stays decodable.
+
+    Compared to the OTLP JSON format this roughly halves bytes written for
+    dict-heavy records and skips all key-string escaping per record, while
+    remaining newline-delimited text that rotation and compression already
+    understand.
+    """
+
+    # LogRecord attributes excluded when collecting extras; mirrors the
+    # frozenset in otlp_formatter
+    _STANDARD_ATTRS = frozenset({
+        'args', 'created', 'exc_info', 'exc_text', 'filename', 'funcName',
+        'levelname', 'levelno', 'lineno', 'module', 'msecs', 'msg', 'name',
+        'pathname', 'process', 'processName', 'relativeCreated', 'stack_info',
+        'taskName', 'thread', 'threadName', 'getMessage', 'otlp_attributes',
+        'otlp_payload', 'message', 'asctime'
+    })
+
+    def __init__(self, index_path: Optional[str] = None):
+        self.index_path = index_path
+        # schema (tuple of key names) -> interned integer id
+        self._schema_ids: Dict[tuple, int] = {}
+        self._index_dirty = False
+        if index_path:
+            atexit.register(self._write_index)
+
+    def _dumps(self, obj: Any) -> str:
+        if orjson is not None:
+            try:
+                return orjson.dumps(obj).decode()
+            except TypeError:
+                pass
+        return json.dumps(obj, ensure_ascii=False)
+
+    def _intern_schema(self, schema: tuple) -> int:
+        schema_id = self._schema_ids.get(schema)
+        if schema_id is None:
+            schema_id = len(self._schema_ids)
+            self._schema_ids[schema] = schema_id
+            self._index_dirty = True
+        return schema_id
+
+    def _write_index(self):
+        """Dump the id -> schema index sidecar so the log is decodable."""
+        if not self._index_dirty or not self.index_path:
+            return
+        try:
+            index = {str(schema_id): list(schema)
+                     for schema, schema_id in self._schema_ids.items()}
+            with open(self.index_path, "w") as f:
+                f.write(self._dumps(index))
+            self._index_dirty = False
+        except Exception as e:
+            try:
+                print(f"Binary log index write error: {type(e).__name__}: {e}",
+                      file=sys.stderr)
+            except Exception:
+                pass
+
+    def format(self, record) -> str:
+        """Format the record as one schema-interned JSON array line."""
+        try:
+            standard = self._STANDARD_ATTRS
+            extras = [(name, value) for name, value in record.__dict__.items()
+                      if name not in standard and not name.startswith('_')
+                      and value is not None and not callable(value)]
+            schema = tuple(name for name, _ in extras)
+            schema_id = self._intern_schema(schema)
+            row = [schema_id, record.created, record.levelno, record.getMessage()]
+            row.extend(value for _, value in extras)
+            return self._dumps(row)
+        except Exception as e:
+            # Fallback mirrors the OTLP formatter: never lose the record
+            return self._dumps([-1, time.time(), record.levelno,
+                                record.getMessage(),
+                                f"Failed to format log record: {str(e)}"])
+
+    def formatTime(self, record, datefmt=None):
+        """Timestamps are emitted raw as record.created (epoch seconds)."""
+        return str(record.created)
@@ -34,6 +34,11 @@ except Exception as e:
         handler.setFormatter(formatter)
         logger.addHandler(handler)
 
+# Sensitive-keyword patterns compiled once into a single regex so each
+# variable name is checked with one C-level scan instead of a Python loop
+# of substring tests
+_SENSITIVE_PATTERN = re.compile("_KEY|DATABASE_URL|PASSWORD|SECRET")
+
 def mask_sensitive_value(value: str, show_chars: int = 2) -> str:
     """Mask sensitive values by showing only the first few characters."""
     try:
@@ -49,9 +54,7 @@ def is_sensitive_variable(var_name: str) -> bool:
     try:
         if not var_name:
             return True
-        sensitive_patterns = ['_KEY', 'DATABASE_URL', 'PASSWORD', 'SECRET']
-        var_name_upper = var_name.upper()
-        return any(pattern in var_name_upper for pattern in sensitive_patterns)
+        return _SENSITIVE_PATTERN.search(var_name.upper()) is not None
     except Exception as e:
         logger.error(f"❌ Error checking variable sensitivity: {e}")
         return True
@@ -64,16 +67,13 @@ def get_env_vars_with_masking() -> Dict[str, Any]:
         Dictionary with all environment variables, sensitive ones masked
     """
     try:
-        env_vars = {}
-        all_env_vars = dict(os.environ)
-        
-        for var_name, var_value in all_env_vars.items():
-            if is_sensitive_variable(var_name):
-                env_vars[var_name] = mask_sensitive_value(var_value)
-            else:
-                env_vars[var_name] = var_value
-        
-        return env_vars
+        # Snapshot os.environ once (each access through the _Environ wrapper
+        # re-decodes), then build the masked dict in a single comprehension
+        snapshot = os.environ.copy()
+        return {
+            var_name: mask_sensitive_value(var_value) if is_sensitive_variable(var_name) else var_value
+            for var_name, var_value in snapshot.items()
+        }
     except Exception as e:
         logger.error(f"❌ Error getting environment variables: {e}")
         return {}
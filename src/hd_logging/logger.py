@@ -1,10 +1,176 @@
 import logging
+import logging.handlers
 import os
 from typing import Optional
 import colorlog
 from hd_logging.SizeAndTimeLoggingHandler import SizeAndTimeLoggingHandler as STLH
+from hd_logging.binary_formatter import BinaryLogFormatter
 import time
 
+
+# LogRecord attributes that user-supplied extras may not overwrite; module
+# level frozenset so the common-case rejection below is a single C-level
+# isdisjoint call
+_RESERVED_KEYS = frozenset({'message', 'asctime', 'filename'})
+
+
+def _sanitize_extra(extra):
+    """Sanitize extra dict to remove reserved LogRecord keys.
+
+    Args:
+        extra: The extra dict passed to logging methods, or None
+
+    Returns:
+        The sanitized extra dict with reserved keys renamed, or None/unchanged if no sanitization needed
+    """
+    # Handle None and non-dict types
+    if extra is None:
+        return None
+    if not isinstance(extra, dict):
+        # If extra is not a dict, return as-is (logging will handle the error)
+        return extra
+    if not extra:  # Empty dict
+        return extra
+
+    # Fast reject: the vast majority of extras contain no reserved keys, and
+    # dict-keys isdisjoint against a frozenset settles that in one call
+    # without building a set or iterating in Python
+    if _RESERVED_KEYS.isdisjoint(extra):
+        return extra
+
+    # Create a copy to avoid modifying the original
+    sanitized = extra.copy()
+    if 'message' in sanitized:
+        sanitized['log_message'] = sanitized.pop('message')
+    if 'asctime' in sanitized:
+        sanitized['log_asctime'] = sanitized.pop('asctime')
+    if 'filename' in sanitized:
+        sanitized['log_filename'] = sanitized.pop('filename')
+    return sanitized
+
+
+def _patch_logger_methods(logger: logging.Logger) -> None:
+    """Wrap logger methods once so every call sanitizes its extra dict.
+
+    The wrappers are deliberately thin: the common case (no extra) skips the
+    sanitizer entirely, so per-record overhead on the hot path stays minimal.
+    """
+    original_warning = logger.warning
+    original_error = logger.error
+    original_info = logger.info
+    original_debug = logger.debug
+    original_critical = logger.critical
+    original_log = logger.log
+
+    # Use **kwargs for maximum compatibility across Python versions
+    # Python's logging methods accept and ignore unknown kwargs in modern versions
+    def patched_warning(msg, *args, extra=None, **kwargs):
+        # Sanitize extra and pass it as a keyword argument
+        # Always pass extra (even if None) to maintain consistent behavior
+        return original_warning(msg, *args, extra=extra if extra is None else _sanitize_extra(extra), **kwargs)
+
+    def patched_error(msg, *args, extra=None, **kwargs):
+        return original_error(msg, *args, extra=extra if extra is None else _sanitize_extra(extra), **kwargs)
+
+    def patched_info(msg, *args, extra=None, **kwargs):
+        return original_info(msg, *args, extra=extra if extra is None else _sanitize_extra(extra), **kwargs)
+
+    def patched_debug(msg, *args, extra=None, **kwargs):
+        return original_debug(msg, *args, extra=extra if extra is None else _sanitize_extra(extra), **kwargs)
+
+    def patched_critical(msg, *args, extra=None, **kwargs):
+        return original_critical(msg, *args, extra=extra if extra is None else _sanitize_extra(extra), **kwargs)
+
+    def patched_log(level, msg, *args, extra=None, **kwargs):
+        return original_log(level, msg, *args, extra=extra if extra is None else _sanitize_extra(extra), **kwargs)
+
+    def log_many(level, messages, extra=None):
+        """Log a batch of pre-built messages in one pass.
+
+        Performs a single level check and acquires each handler's lock once
+        for the whole batch instead of once per record, amortizing lock and
+        dispatch cost across all messages.
+
+        Args:
+            level (int): Log level for every message in the batch.
+            messages (Iterable[str]): Pre-built message strings.
+            extra (dict, optional): Extra dict applied to every record.
+        """
+        if not logger.isEnabledFor(level):
+            return
+        sanitized = extra if extra is None else _sanitize_extra(extra)
+        records = [
+            logger.makeRecord(logger.name, level, "(batched)", 0, msg, (), None,
+                              func="log_many", extra=sanitized)
+            for msg in messages
+        ]
+        for handler in logger.handlers:
+            if level < handler.level:
+                continue
+            handler.acquire()
+            try:
+                for record in records:
+                    handler.emit(record)
+            finally:
+                handler.release()
+
+    def structured(level, msg, payload, **kwargs):
+        """Log a message whose attributes are already JSON-serialized.
+
+        The OTLP formatter splices the pre-encoded payload into the record
+        by string concatenation instead of re-serializing it, skipping the
+        dominant JSON-encoding cost for records with large attribute dicts.
+
+        Args:
+            level (int): Log level.
+            msg (str): Log message.
+            payload (str | bytes): A JSON object string (e.g. from a Pydantic
+                model's model_dump_json()) used as the record's attributes.
+        """
+        return original_log(level, msg, extra={"otlp_payload": payload}, **kwargs)
+
+    # Apply patches
+    logger.warning = patched_warning
+    logger.error = patched_error
+    logger.info = patched_info
+    logger.debug = patched_debug
+    logger.critical = patched_critical
+    logger.log = patched_log
+    logger.log_many = log_many
+    logger.structured = structured
+    logger._extra_sanitized = True  # Mark as sanitized
+
+
+# Cache of fully-configured loggers keyed by (logger_name, log_file_path) so
+# repeat setup_logger calls skip environment lookups, method wrapping checks,
+# and handler construction entirely
+_LOGGER_CACHE = {}
+
+_ISO_TIME_FORMAT = "%Y-%m-%dT%H:%M:%S%z"
+
+# Set the converter for all Formatters to use UTC
+logging.Formatter.converter = time.gmtime
+
+# The formatters are stateless, so they are built once at import and shared
+# by every logger rather than reconstructed on each setup_logger call
+_FILE_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s - [Component: %(module)s, Function: %(funcName)s, Line: %(lineno)d]',
+    datefmt=_ISO_TIME_FORMAT
+)
+
+_CONSOLE_FORMATTER = colorlog.ColoredFormatter(
+    "%(log_color)s%(asctime)s - %(name)s - %(levelname)s - %(message)s - [Component: %(module)s, Function: %(funcName)s, Line: %(lineno)d]",
+    log_colors={
+        'DEBUG': 'cyan',
+        'INFO': 'green',
+        'WARNING': 'yellow',
+        'ERROR': 'red',
+        'CRITICAL': 'bold_red',
+    },
+    datefmt=_ISO_TIME_FORMAT
+)
+
+
 def setup_logger(
     logger_name: str,
     log_file_path: Optional[str] = None,
@@ -13,7 +179,10 @@ def setup_logger(
     use_otlp_format: bool = None,
     service_name: Optional[str] = None,
     environment: Optional[str] = None,
-    service_version: Optional[str] = None
+    service_version: Optional[str] = None,
+    buffer_capacity: Optional[int] = None,
+    log_flush_level: Optional[int] = None,
+    use_binary_format: bool = False
 ) -> logging.Logger:
     """
     Set up a standardized logger with colorized console output and size+time rotating file handler.
@@ -26,10 +195,28 @@ def setup_logger(
         log_file_path (str, optional): Path to the log file. Defaults to 'hd_shared.log' if not specified.
         log_level_console (int, optional): Console log level. Defaults to LOG_LEVEL env or logging.INFO.
         log_level_files (int, optional): File log level. Defaults to LOG_LEVEL env or logging.INFO.
+        buffer_capacity (int, optional): When set, buffer up to this many records
+            in memory and flush them to the file handler in one batch (records at
+            ERROR or above flush immediately). Defaults to unbuffered.
+        log_flush_level (int, optional): When set, file records below this
+            level skip the per-record flush and rely on the stream's block
+            buffering; records at or above it still flush immediately.
+            Defaults to flushing every record.
+        use_binary_format (bool, optional): When True, the file handler emits
+            compact schema-interned JSON array lines (see BinaryLogFormatter)
+            instead of OTLP/plain text. Overrides use_otlp_format for the
+            file handler. Defaults to False.
 
     Returns:
         logging.Logger: Configured logger instance.
     """
+    # Fast path: a logger already configured for this (name, path) pair is
+    # returned as-is, avoiding redundant file opens and handler allocation
+    cache_key = (logger_name, log_file_path)
+    cached = _LOGGER_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
     # Environment/config defaults
     log_file_path = log_file_path or os.getenv("LOG_FILE", "logs/hd_logging.log")
     env_log_level = os.getenv("LOG_LEVEL", "INFO").upper()
@@ -49,110 +236,19 @@ def setup_logger(
 
     # CRITICAL FIX: Sanitize extra dict to prevent "Attempt to overwrite 'message' in LogRecord" errors
     # This must be applied even if handlers are already set, to ensure all loggers are protected
-    def _sanitize_extra(extra):
-        """Sanitize extra dict to remove reserved LogRecord keys.
-        
-        Args:
-            extra: The extra dict passed to logging methods, or None
-            
-        Returns:
-            The sanitized extra dict with reserved keys renamed, or None/unchanged if no sanitization needed
-        """
-        # Handle None and non-dict types
-        if extra is None:
-            return None
-        if not isinstance(extra, dict):
-            # If extra is not a dict, return as-is (logging will handle the error)
-            return extra
-        if not extra:  # Empty dict
-            return extra
-        
-        # Check if any reserved keys are present
-        # These are LogRecord attributes that cannot be overwritten
-        reserved_keys = {'message', 'asctime', 'filename'}
-        if any(key in extra for key in reserved_keys):
-            # Create a copy to avoid modifying the original
-            sanitized = extra.copy()
-            if 'message' in sanitized:
-                sanitized['log_message'] = sanitized.pop('message')
-            if 'asctime' in sanitized:
-                sanitized['log_asctime'] = sanitized.pop('asctime')
-            if 'filename' in sanitized:
-                sanitized['log_filename'] = sanitized.pop('filename')
-            return sanitized
-        return extra
-
     # Only wrap logger methods if not already wrapped (prevent duplicate wrapping)
     if not getattr(logger, "_extra_sanitized", False):
-        # Wrap logger methods to sanitize extra dict
-        original_warning = logger.warning
-        original_error = logger.error
-        original_info = logger.info
-        original_debug = logger.debug
-        original_critical = logger.critical
-        original_log = logger.log
-
-        # Use **kwargs for maximum compatibility across Python versions
-        # Python's logging methods accept and ignore unknown kwargs in modern versions
-        def patched_warning(msg, *args, extra=None, **kwargs):
-            # Sanitize extra and pass it as a keyword argument
-            # Always pass extra (even if None) to maintain consistent behavior
-            return original_warning(msg, *args, extra=_sanitize_extra(extra), **kwargs)
-        
-        def patched_error(msg, *args, extra=None, **kwargs):
-            return original_error(msg, *args, extra=_sanitize_extra(extra), **kwargs)
-        
-        def patched_info(msg, *args, extra=None, **kwargs):
-            return original_info(msg, *args, extra=_sanitize_extra(extra), **kwargs)
-        
-        def patched_debug(msg, *args, extra=None, **kwargs):
-            return original_debug(msg, *args, extra=_sanitize_extra(extra), **kwargs)
-        
-        def patched_critical(msg, *args, extra=None, **kwargs):
-            return original_critical(msg, *args, extra=_sanitize_extra(extra), **kwargs)
-        
-        def patched_log(level, msg, *args, extra=None, **kwargs):
-            return original_log(level, msg, *args, extra=_sanitize_extra(extra), **kwargs)
-
-        # Apply patches
-        logger.warning = patched_warning
-        logger.error = patched_error
-        logger.info = patched_info
-        logger.debug = patched_debug
-        logger.critical = patched_critical
-        logger.log = patched_log
-        logger._extra_sanitized = True  # Mark as sanitized
+        _patch_logger_methods(logger)
 
     # Prevent duplicate handlers
     if getattr(logger, "_custom_handlers_set", False):
+        _LOGGER_CACHE[cache_key] = logger
         return logger
 
-    iso_time_format = "%Y-%m-%dT%H:%M:%S%z"
-    # Set the converter for all Formatters to use UTC
-    logging.Formatter.converter = time.gmtime
-    # File formatter
-    file_formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s - [Component: %(module)s, Function: %(funcName)s, Line: %(lineno)d]',
-        datefmt=iso_time_format
-    )
-
-    # Colorized console formatter
-    console_formatter = colorlog.ColoredFormatter(
-        "%(log_color)s%(asctime)s - %(name)s - %(levelname)s - %(message)s - [Component: %(module)s, Function: %(funcName)s, Line: %(lineno)d]",
-        log_colors={
-            'DEBUG': 'cyan',
-            'INFO': 'green',
-            'WARNING': 'yellow',
-            'ERROR': 'red',
-            'CRITICAL': 'bold_red',
-        },
-        datefmt=iso_time_format
-    )
-
     # Console handler
     console_handler = logging.StreamHandler()
     console_handler.setLevel(log_level_console)
-    console_handler.setFormatter(console_formatter)
+    console_handler.setFormatter(_CONSOLE_FORMATTER)
     logger.addHandler(console_handler)
 
     # Ensure log directory exists if log_file_path is set
@@ -167,23 +263,42 @@ def setup_logger(
         interval=1,
         backupCount=7,
         maxBytes=20_000_000,
-        use_otlp_format=use_otlp_format,
+        use_otlp_format=use_otlp_format and not use_binary_format,
         service_name=service_name,
         environment=environment,
-        service_version=service_version
+        service_version=service_version,
+        flush_level=log_flush_level
     )
     stime_handler.setLevel(log_level_files)
     
-    # Set formatter based on OTLP format preference
-    if use_otlp_format:
+    # Set formatter based on format preference
+    if use_binary_format:
+        # Compact schema-interned array lines; the id->schema index sidecar
+        # lands next to the log file
+        stime_handler.setFormatter(BinaryLogFormatter(index_path=log_file_path + ".idx"))
+    elif use_otlp_format:
         # OTLP formatter is already set in the handler
         pass
     else:
-        stime_handler.setFormatter(file_formatter)
+        stime_handler.setFormatter(_FILE_FORMATTER)
     
-    logger.addHandler(stime_handler)
+    if buffer_capacity:
+        # Group commit with stdlib machinery: records accumulate in memory and
+        # hit the file handler in one batch when the buffer fills, an ERROR
+        # (or worse) arrives, or the handler is closed
+        buffered_handler = logging.handlers.MemoryHandler(
+            capacity=buffer_capacity,
+            flushLevel=logging.ERROR,
+            target=stime_handler,
+            flushOnClose=True
+        )
+        buffered_handler.setLevel(log_level_files)
+        logger.addHandler(buffered_handler)
+    else:
+        logger.addHandler(stime_handler)
 
     # Mark as configured to prevent duplicate handlers
     logger._custom_handlers_set = True
 
-    return logger 
+    _LOGGER_CACHE[cache_key] = logger
+    return logger
@@ -12,6 +12,27 @@ import time
 from datetime import datetime, timezone
 from typing import Dict, Any, Optional
 
+# orjson serializes dict-heavy records several times faster than stdlib json;
+# it is optional, so fall back to stdlib when it is not installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Standard LogRecord attributes that are not user-supplied extras.
+# CRITICAL: 'message' and 'asctime' are reserved LogRecord properties that cannot
+# be overwritten. They must be excluded to prevent KeyError in makeRecord.
+# Kept at module level as a frozenset for C-level membership tests.
+_STANDARD_ATTRS = frozenset({
+    'args', 'created', 'exc_info', 'exc_text', 'filename', 'funcName',
+    'levelname', 'levelno', 'lineno', 'module', 'msecs', 'msg', 'name',
+    'pathname', 'process', 'processName', 'relativeCreated', 'stack_info',
+    'taskName', 'thread', 'threadName', 'getMessage', 'otlp_attributes',
+    'otlp_payload',  # Pre-serialized attributes payload (handled in format())
+    'message',  # Reserved LogRecord property (computed from msg + args)
+    'asctime'   # Reserved LogRecord property (formatted timestamp)
+})
+
 
 class OpenTelemetryFormatter:
     """Formats log records to OpenTelemetry JSON format."""
@@ -22,7 +43,31 @@ class OpenTelemetryFormatter:
         self.environment = environment
         self.service_version = service_version
         self.resource_attributes = self._get_resource_attributes()
+        # Per-logger constant attributes, built once here and copied into
+        # each record instead of re-read from self per format() call
+        self._static_attributes = {
+            "service.name": self.service_name,
+            "environment": self.environment
+        }
+        # Resource attributes are invariant for the formatter's lifetime, so
+        # serialize them once and splice the cached JSON into each record
+        # instead of re-encoding the same six fields per emit
+        self._resource_json = self._dumps(self.resource_attributes)
     
+    def _dumps(self, obj: Dict[str, Any]) -> str:
+        """Serialize a record dict with the fastest available JSON encoder."""
+        if orjson is not None:
+            try:
+                # OPT_NON_STR_KEYS matches stdlib behavior for numeric dict
+                # keys, keeping such records on the fast path instead of
+                # bouncing through the TypeError fallback below
+                return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+            except TypeError:
+                # orjson rejects some types stdlib json accepts (e.g. tuples);
+                # fall through to the stdlib encoder for those records
+                pass
+        return json.dumps(obj, ensure_ascii=False)
+
     def _get_resource_attributes(self) -> Dict[str, str]:
         """Get resource attributes for the service."""
         return {
@@ -51,45 +96,30 @@ class OpenTelemetryFormatter:
     
     def _extract_attributes(self, record) -> Dict[str, Any]:
         """Extract attributes from the log record."""
-        # Standard logging attributes
-        attributes = {
-            "service.name": self.service_name,
-            "environment": self.environment,
-            "logger.name": record.name,
-            "component": getattr(record, 'module', 'unknown'),
-            "function": getattr(record, 'funcName', 'unknown'),
-            "line": getattr(record, 'lineno', 0),
-            "thread.name": getattr(record, 'threadName', 'unknown'),
-            "process.name": getattr(record, 'processName', 'unknown'),
-            "process.id": getattr(record, 'process', 0)
-        }
+        # Standard logging attributes; the per-logger constants come from the
+        # prebuilt template
+        attributes = self._static_attributes.copy()
+        attributes["logger.name"] = record.name
+        attributes["component"] = getattr(record, 'module', 'unknown')
+        attributes["function"] = getattr(record, 'funcName', 'unknown')
+        attributes["line"] = getattr(record, 'lineno', 0)
+        attributes["thread.name"] = getattr(record, 'threadName', 'unknown')
+        attributes["process.name"] = getattr(record, 'processName', 'unknown')
+        attributes["process.id"] = getattr(record, 'process', 0)
         
         # Add any custom attributes from the record (otlp_attributes)
         if hasattr(record, 'otlp_attributes'):
             attributes.update(record.otlp_attributes)
         
-        # Add ALL custom attributes from extra parameter
-        # Get all attributes from the record and filter out standard logging ones
-        # CRITICAL: 'message' and 'asctime' are reserved LogRecord properties that cannot
-        # be overwritten. They must be excluded to prevent KeyError in makeRecord.
-        standard_attrs = {
-            'args', 'created', 'exc_info', 'exc_text', 'filename', 'funcName', 
-            'levelname', 'levelno', 'lineno', 'module', 'msecs', 'msg', 'name', 
-            'pathname', 'process', 'processName', 'relativeCreated', 'stack_info', 
-            'taskName', 'thread', 'threadName', 'getMessage', 'otlp_attributes',
-            'message',  # Reserved LogRecord property (computed from msg + args)
-            'asctime'   # Reserved LogRecord property (formatted timestamp)
-        }
-        
-        for attr_name in dir(record):
-            if not attr_name.startswith('_') and attr_name not in standard_attrs:
-                try:
-                    attr_value = getattr(record, attr_name)
-                    if not callable(attr_value) and attr_value is not None:
-                        attributes[attr_name] = attr_value
-                except (AttributeError, TypeError):
-                    # Skip attributes that can't be accessed
-                    pass
+        # Add ALL custom attributes from extra parameter.
+        # Extras are stored directly in the record's instance __dict__, so
+        # iterating it reaches only real per-record values; this avoids the
+        # dir() walk over the whole class plus a getattr per name, which
+        # dominated the cost of formatting each record.
+        for attr_name, attr_value in record.__dict__.items():
+            if (attr_name not in _STANDARD_ATTRS and not attr_name.startswith('_')
+                    and attr_value is not None and not callable(attr_value)):
+                attributes[attr_name] = attr_value
         
         # Add exception info if present
         if record.exc_info:
@@ -98,25 +128,47 @@ class OpenTelemetryFormatter:
         
         return attributes
     
+    def _format_prebuilt(self, record, payload) -> str:
+        """Build an OTLP record around an already-serialized attributes payload.
+
+        The payload is spliced into the output by string concatenation, so it
+        is never parsed or re-serialized on the hot path.
+        """
+        if isinstance(payload, (bytes, bytearray)):
+            payload = payload.decode()
+        envelope = {
+            "timestamp": self._format_timestamp(record.created),
+            "severityText": record.levelname,
+            "body": record.getMessage()
+        }
+        head = self._dumps(envelope)
+        return (head[:-1] + ',"attributes":' + payload +
+                ',"resource":' + self._resource_json + '}')
+
     def format(self, record) -> str:
         """Format the log record to OpenTelemetry JSON format."""
         try:
+            payload = record.__dict__.get('otlp_payload')
+            if payload is not None:
+                return self._format_prebuilt(record, payload)
+
             otlp_record = {
                 "timestamp": self._format_timestamp(record.created),
                 "severityText": record.levelname,
                 "body": record.getMessage(),
-                "attributes": self._extract_attributes(record),
-                "resource": self.resource_attributes
+                "attributes": self._extract_attributes(record)
             }
-            
+
             # Add tracing information if available
             if hasattr(record, 'traceId'):
                 otlp_record["traceId"] = record.traceId
             if hasattr(record, 'spanId'):
                 otlp_record["spanId"] = record.spanId
-            
-            return json.dumps(otlp_record, ensure_ascii=False)
-            
+
+            # Splice in the pre-serialized resource block
+            return (self._dumps(otlp_record)[:-1] +
+                    ',"resource":' + self._resource_json + '}')
+
         except Exception as e:
             # Fallback to simple JSON if formatting fails
             fallback_record = {
@@ -125,7 +177,7 @@ class OpenTelemetryFormatter:
                 "body": record.getMessage(),
                 "error": f"Failed to format log record: {str(e)}"
             }
-            return json.dumps(fallback_record, ensure_ascii=False)
+            return self._dumps(fallback_record)
     
     def formatTime(self, record, datefmt=None):
         """Format the timestamp (for compatibility with logging.Formatter)."""
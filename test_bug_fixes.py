@@ -13,10 +13,9 @@ import sys
 import os
 import tempfile
 import shutil
-from pathlib import Path
 
 # Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
 
 from hd_logging import setup_logger
 import logging
@@ -204,17 +203,22 @@ def run_all_tests():
         test_all_logging_methods,
     ]
     
-    results = []
-    for test in tests:
+    def _safe(test):
         try:
-            result = test()
-            results.append(result)
+            return test()
         except Exception as e:
             print(f"❌ FAIL: Test {test.__name__} crashed: {e}")
             import traceback
             traceback.print_exc()
-            results.append(False)
-    
+            return False
+
+    # Each test uses its own logger name and temp dir, so they are
+    # independent; running them on a thread pool cuts suite wall-clock time
+    # and exercises setup_logger under concurrency. ex.map preserves order.
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=len(tests)) as ex:
+        results = list(ex.map(_safe, tests))
+
     print("\n" + "=" * 60)
     print("Test Results Summary")
     print("=" * 60)